@@ -37,12 +37,14 @@ class TransactionHashPrefix(IntEnum):
 class CommonTransactionV3Fields:
     # pylint: disable=too-many-instance-attributes
 
-    tx_prefix: TransactionHashPrefix
+    # Accepts plain ints as well as TransactionHashPrefix members (an IntEnum)
+    # - callers on the hot path pass the prefixes pre-resolved to ints.
+    tx_prefix: int
     version: int
     address: int
     tip: int
     resource_bounds: ResourceBoundsMapping
-    paymaster_data: List[int]
+    paymaster_data: Sequence[int]
     chain_id: int
     nonce: int
     nonce_data_availability_mode: DAMode
@@ -172,7 +174,7 @@ def compute_invoke_transaction_hash(
 
 def compute_invoke_v3_transaction_hash(
     *,
-    account_deployment_data: List[int],
+    account_deployment_data: Sequence[int],
     calldata: List[int],
     common_fields: CommonTransactionV3Fields,
 ) -> int:
@@ -333,7 +335,7 @@ def compute_declare_v3_transaction_hash(
     *,
     contract_class: Optional[SierraContractClass] = None,
     class_hash: Optional[int] = None,
-    account_deployment_data: List[int],
+    account_deployment_data: Sequence[int],
     compiled_class_hash: int,
     common_fields: CommonTransactionV3Fields,
 ) -> int:
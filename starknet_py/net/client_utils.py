@@ -8,6 +8,11 @@ from starknet_py.net.client_models import Hash, L1HandlerTransaction, Tag
 from starknet_py.net.models.transaction import AccountTransaction
 from starknet_py.net.schemas.broadcasted_txn import BroadcastedTransactionSchema
 
+# Instantiating a marshmallow schema resolves and binds all of its fields, which is
+# expensive enough to dominate serialization cost when transactions are dumped in bulk.
+# Schemas are stateless after construction, so a single shared instance is safe.
+_BROADCASTED_TXN_SCHEMA = BroadcastedTransactionSchema()
+
 
 def hash_to_felt(value: Hash) -> str:
     """
@@ -84,5 +89,5 @@ def _is_valid_eth_address(address: str) -> bool:
 def _create_broadcasted_txn(transaction: AccountTransaction) -> dict:
     return cast(
         Dict,
-        BroadcastedTransactionSchema().dump(obj=transaction),
+        _BROADCASTED_TXN_SCHEMA.dump(obj=transaction),
     )
@@ -6,16 +6,43 @@ They should be compliant with the latest Starknet version.
 
 import base64
 import dataclasses
+import functools
 import gzip
+import io
 import json
+import os
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, TypeVar, Union
+from typing import Any, Dict, Iterator, List, Tuple, TypeVar, Union
 
 import marshmallow
 import marshmallow_dataclass
 from marshmallow import fields
 
+# The 'fast' extra is optional, so pyright runs without these packages
+# installed; the guarded imports are expected to be unresolvable then.
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64  # pyright: ignore[reportMissingImports]
+except ImportError:
+    pybase64 = None
+
+try:
+    from mashumaro.config import BaseConfig  # pyright: ignore[reportMissingImports]
+    from mashumaro.mixins.dict import (  # pyright: ignore[reportMissingImports]
+        DataClassDictMixin,
+    )
+    from mashumaro.types import (  # pyright: ignore[reportMissingImports]
+        SerializationStrategy,
+    )
+except ImportError:
+    DataClassDictMixin = None
+
 from starknet_py.hash.address import compute_address
 from starknet_py.hash.transaction import (
     CommonTransactionV3Fields,
@@ -45,15 +72,159 @@ from starknet_py.net.schemas.gateway import (
 #  consider unifying these classes with client_models
 #  remove marshmallow logic if not needed
 
+# pybase64 is a SIMD-accelerated drop-in for the stdlib codec; on megabyte
+# scale compressed programs the base64 step is itself measurable.
+if pybase64 is not None:
+    _b64encode, _b64decode = pybase64.b64encode, pybase64.b64decode
+else:
+    _b64encode, _b64decode = base64.b64encode, base64.b64decode
+
+# Slot declarations for the lazily-set internal caches, shared by both
+# _TransactionDictCodec variants below. The caches are plain attributes
+# instead of dataclass fields so that they never show up in
+# dataclasses.fields(), the generated marshmallow schemas or
+# dataclasses.asdict. They start unset; readers fall back to None through
+# getattr and writers go through object.__setattr__ because the transaction
+# dataclasses are frozen.
+_TRANSACTION_CACHE_SLOTS = (
+    "_hash_cache",
+    "_common_fields_cache",
+    "_compressed_program_cache",
+)
+
+# When mashumaro is installed (part of the 'fast' extra) the transaction
+# classes additionally expose to_dict()/from_dict() generated at class creation
+# time, which avoid marshmallow's per-field dispatch for bulk internal
+# encoding. Integers in the transaction's own fields (including felt lists)
+# are rendered as hex strings, matching the Felt convention; nested
+# dataclasses such as the resource bounds keep mashumaro's default
+# representation. The JSON-RPC wire format keeps going through marshmallow,
+# which stays the compatibility layer.
+if DataClassDictMixin is not None:
+
+    class _FeltHex(SerializationStrategy):
+        # Without the optional mashumaro install pylint cannot resolve the
+        # SerializationStrategy base and flags these hooks as free functions.
+        # pylint: disable=no-self-use
+
+        def serialize(self, value: int) -> str:
+            return hex(value)
+
+        def deserialize(self, value: Union[int, str]) -> int:
+            return value if isinstance(value, int) else int(value, 16)
+
+    class _TransactionDictCodec(DataClassDictMixin):
+        __slots__ = _TRANSACTION_CACHE_SLOTS
+
+        class Config(BaseConfig):
+            serialization_strategy = {int: _FeltHex()}
+
+else:
+
+    class _TransactionDictCodec:
+        __slots__ = _TRANSACTION_CACHE_SLOTS
+
+
+# Transactions are created in bulk during fee estimation and batching, so on
+# Python 3.10+ the dataclasses are slotted to avoid the per-instance __dict__.
+# Slots must be declared on the whole hierarchy to take effect, hence the
+# shared decorator arguments. Transactions are identified by their hash rather
+# than compared by value, so the generated per-field __eq__ (and the __hash__
+# that frozen=True would pair with it) is skipped as well; instances fall back
+# to identity comparison.
+if sys.version_info >= (3, 10):
+    _TRANSACTION_DATACLASS_ARGS: Dict[str, bool] = {
+        "frozen": True,
+        "slots": True,
+        "eq": False,
+    }
+else:
+    _TRANSACTION_DATACLASS_ARGS = {"frozen": True, "eq": False}
+
+
+@functools.lru_cache(maxsize=128)
+def _deploy_account_contract_address(
+    salt: int, class_hash: int, constructor_calldata: Tuple[int, ...]
+) -> int:
+    # compute_address Pedersen-hashes the whole constructor calldata; a deploy
+    # account transaction is hashed at least twice (estimate + send), so the
+    # derived address is memoized on its inputs.
+    return compute_address(
+        salt=salt,
+        class_hash=class_hash,
+        constructor_calldata=list(constructor_calldata),
+        deployer_address=0,
+    )
+
+
+def _cache_tx_hash(calculate_hash):
+    """
+    Memoize ``calculate_hash`` on the instance, keyed by ``chain_id``.
+
+    The same transaction is typically hashed twice - once when signing and once
+    when sending - and the fields the hash depends on are frozen, so the second
+    computation can be skipped. The ``(chain_id, hash)`` pair lives in one of
+    the ``_TRANSACTION_CACHE_SLOTS``, not a dataclass field, so it is invisible
+    to ``dataclasses.fields()`` and the schemas generated from the transaction
+    classes. ``dataclasses.replace`` creates a new instance, which starts with
+    an empty cache.
+    """
+
+    @functools.wraps(calculate_hash)
+    def wrapper(self, chain_id: int) -> int:
+        cached = getattr(self, "_hash_cache", None)
+        if cached is not None and cached[0] == chain_id:
+            return cached[1]
+        tx_hash = calculate_hash(self, chain_id)
+        object.__setattr__(self, "_hash_cache", (chain_id, tx_hash))
+        return tx_hash
+
+    return wrapper
+
+
+# The prefixes are IntEnum members; resolving them to plain ints once at
+# import skips the enum wrapper on every v3 hash computation.
+_PREFIX_DECLARE = int(TransactionHashPrefix.DECLARE)
+_PREFIX_DEPLOY_ACCOUNT = int(TransactionHashPrefix.DEPLOY_ACCOUNT)
+_PREFIX_INVOKE = int(TransactionHashPrefix.INVOKE)
+
+
+def _codegen_calculate_hash(compute_fn, field_names: Tuple[str, ...]):
+    """
+    Generate a specialized ``calculate_hash`` for transaction classes whose
+    hash is a plain mapping of fields onto ``compute_fn`` keyword arguments.
+    The generated body binds each attribute directly, avoiding the per-call
+    dict building a generic implementation would need. Only applicable when no
+    derived values (contract address, v3 common fields) are involved.
+
+    The returned method is assigned in the class body, so both ABCMeta and
+    static analysis see the abstract method as overridden.
+    """
+    arguments = ", ".join(f"{name}=self.{name}" for name in field_names)
+    source = (
+        "def calculate_hash(self, chain_id: int) -> int:\n"
+        f"    return compute_fn({arguments}, chain_id=chain_id)\n"
+    )
+    namespace = {"compute_fn": compute_fn}
+    # pylint: disable-next=exec-used
+    exec(compile(source, "<calculate_hash codegen>", "exec"), namespace)
+    calculate_hash = namespace["calculate_hash"]
+    calculate_hash.__doc__ = "Calculates the transaction hash in the Starknet network."
+    return _cache_tx_hash(calculate_hash)
+
 
-@dataclass(frozen=True)
-class Transaction(ABC):
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
+class Transaction(ABC, _TransactionDictCodec):
     """
     Starknet transaction base class.
     """
 
     version: int = field(metadata={"marshmallow_field": Felt()})
 
+    # With eq=False the dataclass machinery leaves hashing alone; spell out the
+    # identity-based fallback so it survives future decorator changes.
+    __hash__ = object.__hash__
+
     @property
     @abstractmethod
     def type(self) -> TransactionType:
@@ -69,7 +240,7 @@ class Transaction(ABC):
         """
 
 
-@dataclass(frozen=True)
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class AccountTransaction(Transaction, ABC):
     """
     Represents a transaction in the Starknet network that is originated from an action of an
@@ -86,34 +257,37 @@ class AccountTransaction(Transaction, ABC):
 TypeAccountTransaction = TypeVar("TypeAccountTransaction", bound=AccountTransaction)
 
 
-@dataclass(frozen=True)
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class _DeprecatedAccountTransaction(AccountTransaction, ABC):
     max_fee: int = field(metadata={"marshmallow_field": Felt()})
 
 
-@dataclass(frozen=True)
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class _AccountTransactionV3(AccountTransaction, ABC):
     resource_bounds: ResourceBoundsMapping
     tip: int = field(init=False, default=0)
     nonce_data_availability_mode: DAMode = field(init=False, default=DAMode.L1)
     fee_data_availability_mode: DAMode = field(init=False, default=DAMode.L1)
-    paymaster_data: List[int] = field(init=False, default_factory=list)
+    # A shared empty tuple instead of default_factory=list - the field is
+    # almost always left at its default and a tuple default costs no
+    # per-instance allocation.
+    paymaster_data: Tuple[int, ...] = field(init=False, default=())
 
     def get_common_fields(
         self,
-        tx_prefix: TransactionHashPrefix,
+        tx_prefix: int,
         address: int,
         chain_id: int,
     ) -> CommonTransactionV3Fields:
-        common_fields = [f.name for f in dataclasses.fields(_AccountTransactionV3)]
-
-        # this is a helper function in a process to compute transaction hash
-        # therefore signature is not included at this point
-        common_fields.remove("signature")
-
-        common_fields_with_values = {
-            field_name: getattr(self, field_name) for field_name in common_fields
-        }
+        # The instance-fixed part of CommonTransactionV3Fields is gathered
+        # once; only tx_prefix/address/chain_id vary between calls.
+        common_fields_with_values = getattr(self, "_common_fields_cache", None)
+        if common_fields_with_values is None:
+            common_fields_with_values = {
+                field_name: getattr(self, field_name)
+                for field_name in _COMMON_V3_FIELD_NAMES
+            }
+            object.__setattr__(self, "_common_fields_cache", common_fields_with_values)
 
         return CommonTransactionV3Fields(
             tx_prefix=tx_prefix,
@@ -123,7 +297,19 @@ class _AccountTransactionV3(AccountTransaction, ABC):
         )
 
 
-@dataclass(frozen=True)
+# Resolved once at import time - dataclasses.fields() rebuilds its tuple on
+# every call, which get_common_fields would otherwise pay on each transaction
+# hash. signature is excluded because the hash is computed before signing;
+# underscore-prefixed names are reserved for internal attributes and never map
+# to CommonTransactionV3Fields arguments.
+_COMMON_V3_FIELD_NAMES = tuple(
+    f.name
+    for f in dataclasses.fields(_AccountTransactionV3)
+    if f.name != "signature" and not f.name.startswith("_")
+)
+
+
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class DeclareV3(_AccountTransactionV3):
     """
     Represents a transaction in the Starknet network that is a version 3 declaration of a Starknet contract
@@ -133,23 +319,24 @@ class DeclareV3(_AccountTransactionV3):
     sender_address: int
     compiled_class_hash: int
     contract_class: SierraContractClass
-    account_deployment_data: List[int] = field(default_factory=list)
+    account_deployment_data: Tuple[int, ...] = ()
     type: TransactionType = TransactionType.DECLARE
 
+    @_cache_tx_hash
     def calculate_hash(self, chain_id: int) -> int:
         return compute_declare_v3_transaction_hash(
             account_deployment_data=self.account_deployment_data,
             contract_class=self.contract_class,
             compiled_class_hash=self.compiled_class_hash,
             common_fields=self.get_common_fields(
-                tx_prefix=TransactionHashPrefix.DECLARE,
+                tx_prefix=_PREFIX_DECLARE,
                 address=self.sender_address,
                 chain_id=chain_id,
             ),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class DeclareV2(_DeprecatedAccountTransaction):
     """
     Represents a transaction in the Starknet network that is a version 2 declaration of a Starknet contract
@@ -166,19 +353,20 @@ class DeclareV2(_DeprecatedAccountTransaction):
         default=TransactionType.DECLARE,
     )
 
-    def calculate_hash(self, chain_id: int) -> int:
-        return compute_declare_v2_transaction_hash(
-            contract_class=self.contract_class,
-            compiled_class_hash=self.compiled_class_hash,
-            chain_id=chain_id,
-            sender_address=self.sender_address,
-            max_fee=self.max_fee,
-            version=self.version,
-            nonce=self.nonce,
-        )
+    calculate_hash = _codegen_calculate_hash(
+        compute_declare_v2_transaction_hash,
+        (
+            "contract_class",
+            "compiled_class_hash",
+            "sender_address",
+            "max_fee",
+            "version",
+            "nonce",
+        ),
+    )
 
 
-@dataclass(frozen=True)
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class DeclareV1(_DeprecatedAccountTransaction):
     """
     Represents a transaction in the Starknet network that is a declaration of a Starknet contract
@@ -196,33 +384,27 @@ class DeclareV1(_DeprecatedAccountTransaction):
         default=TransactionType.DECLARE,
     )
 
-    @marshmallow.post_dump
-    def post_dump(self, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+    calculate_hash = _codegen_calculate_hash(
+        compute_declare_transaction_hash,
+        ("contract_class", "sender_address", "max_fee", "version", "nonce"),
+    )
+
+    @marshmallow.post_dump(pass_original=True)
+    def post_dump(
+        self, data: Dict[str, Any], original: "DeclareV1", **kwargs
+    ) -> Dict[str, Any]:
         # Allowing **kwargs is needed here because marshmallow is passing additional parameters here
         # along with data, which we don't handle.
         # pylint: disable=unused-argument, no-self-use
-        return compress_program(data)
+        return _compress_program_cached(original, data)
 
     @marshmallow.pre_load
     def pre_load(self, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         # pylint: disable=unused-argument, no-self-use
         return decompress_program(data)
 
-    def calculate_hash(self, chain_id: int) -> int:
-        """
-        Calculates the transaction hash in the Starknet network.
-        """
-        return compute_declare_transaction_hash(
-            contract_class=self.contract_class,
-            chain_id=chain_id,
-            sender_address=self.sender_address,
-            max_fee=self.max_fee,
-            version=self.version,
-            nonce=self.nonce,
-        )
-
 
-@dataclass(frozen=True)
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class DeployAccountV3(_AccountTransactionV3):
     """
     Represents a transaction in the Starknet network that is a version 3 deployment of a Starknet account
@@ -234,26 +416,26 @@ class DeployAccountV3(_AccountTransactionV3):
     constructor_calldata: List[int]
     type: TransactionType = TransactionType.DEPLOY_ACCOUNT
 
+    @_cache_tx_hash
     def calculate_hash(self, chain_id: int) -> int:
-        contract_address = compute_address(
-            salt=self.contract_address_salt,
-            class_hash=self.class_hash,
-            constructor_calldata=self.constructor_calldata,
-            deployer_address=0,
+        contract_address = _deploy_account_contract_address(
+            self.contract_address_salt,
+            self.class_hash,
+            tuple(self.constructor_calldata),
         )
         return compute_deploy_account_v3_transaction_hash(
             class_hash=self.class_hash,
             constructor_calldata=self.constructor_calldata,
             contract_address_salt=self.contract_address_salt,
             common_fields=self.get_common_fields(
-                tx_prefix=TransactionHashPrefix.DEPLOY_ACCOUNT,
+                tx_prefix=_PREFIX_DEPLOY_ACCOUNT,
                 address=contract_address,
                 chain_id=chain_id,
             ),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class DeployAccountV1(_DeprecatedAccountTransaction):
     """
     Represents a transaction in the Starknet network that is a deployment of a Starknet account
@@ -270,15 +452,15 @@ class DeployAccountV1(_DeprecatedAccountTransaction):
         default=TransactionType.DEPLOY_ACCOUNT,
     )
 
+    @_cache_tx_hash
     def calculate_hash(self, chain_id: int) -> int:
         """
         Calculates the transaction hash in the Starknet network.
         """
-        contract_address = compute_address(
-            salt=self.contract_address_salt,
-            class_hash=self.class_hash,
-            constructor_calldata=self.constructor_calldata,
-            deployer_address=0,
+        contract_address = _deploy_account_contract_address(
+            self.contract_address_salt,
+            self.class_hash,
+            tuple(self.constructor_calldata),
         )
         return compute_deploy_account_transaction_hash(
             version=self.version,
@@ -292,7 +474,7 @@ class DeployAccountV1(_DeprecatedAccountTransaction):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class InvokeV3(_AccountTransactionV3):
     """
     Represents a transaction in the Starknet network that is a version 3 invocation of a Cairo contract
@@ -301,22 +483,23 @@ class InvokeV3(_AccountTransactionV3):
 
     calldata: List[int]
     sender_address: int
-    account_deployment_data: List[int] = field(default_factory=list)
+    account_deployment_data: Tuple[int, ...] = ()
     type: TransactionType = TransactionType.INVOKE
 
+    @_cache_tx_hash
     def calculate_hash(self, chain_id: int) -> int:
         return compute_invoke_v3_transaction_hash(
             account_deployment_data=self.account_deployment_data,
             calldata=self.calldata,
             common_fields=self.get_common_fields(
-                tx_prefix=TransactionHashPrefix.INVOKE,
+                tx_prefix=_PREFIX_INVOKE,
                 address=self.sender_address,
                 chain_id=chain_id,
             ),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_TRANSACTION_DATACLASS_ARGS)
 class InvokeV1(_DeprecatedAccountTransaction):
     """
     Represents a transaction in the Starknet network that is an invocation of a Cairo contract
@@ -332,18 +515,10 @@ class InvokeV1(_DeprecatedAccountTransaction):
         default=TransactionType.INVOKE,
     )
 
-    def calculate_hash(self, chain_id: int) -> int:
-        """
-        Calculates the transaction hash in the Starknet network.
-        """
-        return compute_invoke_transaction_hash(
-            version=self.version,
-            sender_address=self.sender_address,
-            calldata=self.calldata,
-            max_fee=self.max_fee,
-            chain_id=chain_id,
-            nonce=self.nonce,
-        )
+    calculate_hash = _codegen_calculate_hash(
+        compute_invoke_transaction_hash,
+        ("version", "sender_address", "calldata", "max_fee", "nonce"),
+    )
 
 
 Declare = Union[DeclareV1, DeclareV2, DeclareV3]
@@ -356,19 +531,88 @@ DeclareV2Schema = marshmallow_dataclass.class_schema(DeclareV2)
 DeployAccountV1Schema = marshmallow_dataclass.class_schema(DeployAccountV1)
 
 
+# Level 9 (the gzip.compress default) spends several times the CPU of level 6
+# for a marginal size gain on contract JSON, and program compression dominates
+# the cost of dumping declare transactions with large programs.
+_COMPRESS_LEVEL = int(os.environ.get("STARKNET_PY_COMPRESS_LEVEL", "6"))
+
+
+def _iter_json_chunks(obj: Any, chunk_size: int = 65536) -> Iterator[bytes]:
+    """
+    Serialize ``obj`` to compact JSON, yielding the result in chunks of roughly
+    ``chunk_size`` bytes instead of materializing the whole document at once.
+    """
+    encoder = json.JSONEncoder(separators=(",", ":"))
+    pending: List[str] = []
+    pending_size = 0
+    for piece in encoder.iterencode(obj):
+        pending.append(piece)
+        pending_size += len(piece)
+        if pending_size >= chunk_size:
+            yield "".join(pending).encode("ascii")
+            pending = []
+            pending_size = 0
+    if pending:
+        yield "".join(pending).encode("ascii")
+
+
+def _compress_program_cached(transaction, data: dict) -> dict:
+    """
+    compress_program backed by the transaction's compressed-program cache.
+
+    The base64 form of the gzipped program is kept in a cache slot on first
+    dump. The contract class of a frozen transaction never changes, so
+    estimating and then sending the same declare does not compress the program
+    twice.
+    """
+    cached = getattr(transaction, "_compressed_program_cache", None)
+    if cached is not None:
+        data["contract_class"]["program"] = cached
+        return data
+    data = compress_program(data)
+    object.__setattr__(
+        transaction, "_compressed_program_cache", data["contract_class"]["program"]
+    )
+    return data
+
+
 def compress_program(data: dict, program_name: str = "program") -> dict:
     program = data["contract_class"][program_name]
-    compressed_program = json.dumps(program)
-    compressed_program = gzip.compress(data=compressed_program.encode("ascii"))
-    compressed_program = base64.b64encode(compressed_program)
-    data["contract_class"][program_name] = compressed_program.decode("ascii")
+    buffer = io.BytesIO()
+    with gzip.GzipFile(
+        fileobj=buffer, mode="wb", compresslevel=_COMPRESS_LEVEL
+    ) as gzipped:
+        if isinstance(program, (bytes, bytearray, memoryview)):
+            # Already serialized JSON (e.g. read straight from a file) - no
+            # need to round-trip it through the encoder.
+            gzipped.write(bytes(program))
+        elif isinstance(program, str):
+            gzipped.write(program.encode("utf-8"))
+        else:
+            serialized = None
+            if orjson is not None:
+                try:
+                    serialized = orjson.dumps(program)
+                except TypeError:
+                    # orjson cannot represent integers outside the 64-bit
+                    # range, which legacy Cairo programs contain.
+                    serialized = None
+            if serialized is not None:
+                gzipped.write(serialized)
+            else:
+                for chunk in _iter_json_chunks(program):
+                    gzipped.write(chunk)
+    data["contract_class"][program_name] = _b64encode(buffer.getvalue()).decode("ascii")
     return data
 
 
 def decompress_program(data: dict, program_name: str = "program") -> dict:
     compressed_program: str = data["contract_class"][program_name]
-    program = base64.b64decode(compressed_program.encode("ascii"))
-    program = gzip.decompress(data=program)
-    program = json.loads(program.decode("ascii"))
+    compressed_buffer = io.BytesIO(_b64decode(compressed_program))
+    with gzip.GzipFile(fileobj=compressed_buffer) as gzipped:
+        # Decoding sticks to the stdlib on purpose: orjson parses integers
+        # outside the 64-bit range as floats, silently losing precision on the
+        # big constants legacy Cairo programs contain.
+        program = json.load(gzipped)
     data["contract_class"][program_name] = program
     return data
@@ -0,0 +1,77 @@
+import pytest
+
+from starknet_py.net.client_models import ResourceBounds, ResourceBoundsMapping
+from starknet_py.net.models.transaction import InvokeV1, InvokeV3
+
+pytest.importorskip("mashumaro")
+
+_CACHE_KEYS = ("_hash_cache", "_common_fields_cache", "_compressed_program_cache")
+
+
+@pytest.fixture(name="invoke_v1")
+def fixture_invoke_v1() -> InvokeV1:
+    return InvokeV1(
+        version=1,
+        signature=[0x1, 0x2],
+        nonce=0x3,
+        max_fee=0x11111,
+        sender_address=0x1234,
+        calldata=[0x1, 0x2, 0x3],
+    )
+
+
+@pytest.fixture(name="invoke_v3")
+def fixture_invoke_v3() -> InvokeV3:
+    return InvokeV3(
+        version=3,
+        signature=[0x1, 0x2],
+        nonce=0x3,
+        resource_bounds=ResourceBoundsMapping(
+            l1_gas=ResourceBounds(
+                max_amount=0x186A0, max_price_per_unit=0x5AF3107A4000
+            ),
+            l2_gas=ResourceBounds(max_amount=0, max_price_per_unit=0),
+        ),
+        sender_address=0x1234,
+        calldata=[0x1, 0x2, 0x3],
+    )
+
+
+def test_to_dict_renders_ints_as_hex(invoke_v1):
+    serialized = invoke_v1.to_dict()
+
+    assert serialized["sender_address"] == "0x1234"
+    assert serialized["max_fee"] == "0x11111"
+    assert serialized["calldata"] == ["0x1", "0x2", "0x3"]
+    assert serialized["signature"] == ["0x1", "0x2"]
+
+
+def test_from_dict_accepts_ints_and_hex_strings(invoke_v1):
+    serialized = invoke_v1.to_dict()
+    serialized["max_fee"] = 0x11111
+
+    deserialized = InvokeV1.from_dict(serialized)
+
+    assert deserialized.max_fee == invoke_v1.max_fee
+    assert deserialized.sender_address == invoke_v1.sender_address
+
+
+@pytest.mark.parametrize("transaction", ["invoke_v1", "invoke_v3"])
+def test_to_dict_from_dict_round_trip(transaction, request):
+    transaction = request.getfixturevalue(transaction)
+
+    deserialized = type(transaction).from_dict(transaction.to_dict())
+
+    assert deserialized.to_dict() == transaction.to_dict()
+    assert deserialized.calculate_hash(0x1) == transaction.calculate_hash(0x1)
+
+
+@pytest.mark.parametrize("transaction", ["invoke_v1", "invoke_v3"])
+def test_to_dict_omits_cache_slots(transaction, request):
+    transaction = request.getfixturevalue(transaction)
+    # Populate the internal caches before dumping.
+    transaction.calculate_hash(0x1)
+
+    serialized = transaction.to_dict()
+
+    assert not any(key in serialized for key in _CACHE_KEYS)
@@ -1,7 +1,10 @@
+import json
 import re
 import typing
 from typing import cast
 
+import pytest
+
 from starknet_py.common import create_contract_class
 from starknet_py.net.client_models import TransactionType
 from starknet_py.net.models.transaction import (
@@ -10,6 +13,8 @@ from starknet_py.net.models.transaction import (
     DeclareV1Schema,
     InvokeV1,
     InvokeV1Schema,
+    compress_program,
+    decompress_program,
 )
 
 
@@ -55,3 +60,39 @@ def test_serialize_deserialize_invoke():
     assert invoke.type == TransactionType.INVOKE
     assert isinstance(serialized_invoke, dict)
     assert serialized_invoke["type"] == "INVOKE_FUNCTION"
+
+
+@pytest.mark.parametrize(
+    "program",
+    [
+        {"builtins": [], "data": ["0x1", "0x2"]},
+        # Legacy Cairo programs contain integer constants far outside the
+        # 64-bit range, which exercises the stdlib json fallback.
+        {"builtins": ["pedersen"], "prime": 2**251 + 17 * 2**192 + 1},
+    ],
+)
+def test_compress_decompress_program(program):
+    data = {"contract_class": {"program": program}}
+
+    compress_program(data)
+
+    assert isinstance(data["contract_class"]["program"], str)
+
+    decompress_program(data)
+
+    assert data["contract_class"]["program"] == program
+
+
+@pytest.mark.parametrize("serialize", [str.encode, lambda serialized: serialized])
+def test_compress_program_accepts_serialized_program(serialize):
+    program = {"builtins": [], "data": ["0x1", "0x2"]}
+    data = {
+        "contract_class": {
+            "program": serialize(json.dumps(program, separators=(",", ":")))
+        }
+    }
+
+    compress_program(data)
+    decompress_program(data)
+
+    assert data["contract_class"]["program"] == program
@@ -2,7 +2,10 @@ from marshmallow import fields, post_dump, pre_load
 from marshmallow_oneofschema import OneOfSchema
 
 from starknet_py.net.client_models import TransactionType
-from starknet_py.net.models.transaction import compress_program, decompress_program
+from starknet_py.net.models.transaction import (
+    _compress_program_cached,
+    decompress_program,
+)
 from starknet_py.net.schemas.gateway import (
     ContractClassSchema,
     SierraCompiledContractSchema,
@@ -34,12 +37,12 @@ class BroadcastedDeclareV1Schema(DeclareTransactionV1Schema):
         ContractClassSchema(), data_key="contract_class", required=True
     )
 
-    @post_dump
-    def post_dump(self, data, **kwargs):
+    @post_dump(pass_original=True)
+    def post_dump(self, data, original, **kwargs):
         # Allowing **kwargs is needed here because marshmallow is passing additional parameters here
         # along with data, which we don't handle.
         # pylint: disable=unused-argument, no-self-use
-        return compress_program(data)
+        return _compress_program_cached(original, data)
 
     @pre_load
     def decompress_program(self, data, **kwargs):
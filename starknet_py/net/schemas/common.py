@@ -41,6 +41,14 @@ class NumberAsHex(fields.Field):
 
     MAX_VALUE = sys.maxsize
     REGEX_PATTERN = r"^0x[a-fA-F0-9]+$"
+    _COMPILED_PATTERN = re.compile(REGEX_PATTERN)
+
+    def __init_subclass__(cls, **kwargs):
+        # Compile the validation pattern once per class so that serializing each
+        # value of e.g. a long calldata list does not go through the re module
+        # cache lookup again.
+        super().__init_subclass__(**kwargs)
+        cls._COMPILED_PATTERN = re.compile(cls.REGEX_PATTERN)
 
     def _serialize(self, value: Any, attr: str, obj: Any, **kwargs):
         if self._is_int_and_in_range(value):
@@ -76,7 +84,7 @@ class NumberAsHex(fields.Field):
     def _is_str_and_valid_pattern(self, value: Any) -> bool:
         return (
             isinstance(value, str)
-            and re.fullmatch(self.REGEX_PATTERN, value) is not None
+            and self._COMPILED_PATTERN.fullmatch(value) is not None
         )
 
 
@@ -207,10 +215,22 @@ class BlockStatusField(fields.Field):
 
 
 class TransactionTypeField(fields.Field):
+    # Built once - every transaction carries a type field, so the per-call enum
+    # member scan is replaced with a single dict lookup in both directions.
+    _SERIALIZED_BY_TYPE = {
+        tx_type: "INVOKE_FUNCTION"
+        if tx_type is TransactionType.INVOKE
+        else tx_type.name
+        for tx_type in TransactionType
+    }
+    _TYPE_BY_SERIALIZED = {
+        **{tx_type.value: tx_type for tx_type in TransactionType},
+        "INVOKE_FUNCTION": TransactionType.INVOKE,
+    }
+
     def _serialize(self, value: Any, attr: str, obj: Any, **kwargs):
-        if value == TransactionType.INVOKE:
-            return "INVOKE_FUNCTION"
-        return value.name
+        serialized = self._SERIALIZED_BY_TYPE.get(value)
+        return serialized if serialized is not None else value.name
 
     def _deserialize(
         self,
@@ -219,17 +239,12 @@ class TransactionTypeField(fields.Field):
         data: Optional[Mapping[str, Any]],
         **kwargs,
     ) -> TransactionType:
-        values = [v.value for v in TransactionType]
-
-        if value == "INVOKE_FUNCTION":
-            value = "INVOKE"
-
-        if value not in values:
+        try:
+            return self._TYPE_BY_SERIALIZED[value]
+        except (KeyError, TypeError) as error:
             raise ValidationError(
                 f"Invalid value provided for TransactionType: {value}."
-            )
-
-        return TransactionType(value)
+            ) from error
 
 
 class EntryPointTypeField(fields.Field):
@@ -3,6 +3,7 @@
 
 import json
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -23,9 +24,13 @@ class CasesRev1(Enum):
     TD = "typed_data_rev_1_example.json"
 
 
+@lru_cache(maxsize=None)
 def load_typed_data(file_name: str) -> TypedData:
     """
     Load TypedData object from file
+
+    The same few fixtures are used across all parametrized tests and are only
+    read, so the parsed object is cached instead of re-read from disk.
     """
     file_path = TYPED_DATA_DIR / file_name
 